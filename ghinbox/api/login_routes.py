@@ -103,12 +103,12 @@ def _require_session(
     if session.state != expected_state:
         logger.warning(
             "Invalid session state: %s (expected %s)",
-            session.state.value,
-            expected_state.value,
+            session.state,
+            expected_state,
         )
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid session state: {session.state.value}",
+            detail=f"Invalid session state: {session.state}",
         )
 
     fetcher = manager.get_fetcher(session_id)
@@ -7,10 +7,11 @@ attempts across multiple HTTP requests.
 
 from __future__ import annotations
 
+import heapq
 import time
-import uuid
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
+from secrets import token_urlsafe
 from threading import Lock
 from typing import TYPE_CHECKING
 
@@ -18,8 +19,12 @@ if TYPE_CHECKING:
     from ghinbox.api.login_fetcher import LoginFetcher
 
 
-class LoginState(Enum):
-    """States in the login state machine."""
+class LoginState(StrEnum):
+    """States in the login state machine.
+
+    Members are ``str`` instances, so they format and JSON-serialize as their
+    value without going through ``.value``.
+    """
 
     INITIALIZED = "initialized"  # Session created, waiting for credentials
     SUBMITTING_CREDENTIALS = "submitting_credentials"  # Submitting to GitHub
@@ -31,7 +36,7 @@ class LoginState(Enum):
     CAPTCHA = "captcha"  # CAPTCHA detected, cannot proceed headlessly
 
 
-@dataclass
+@dataclass(slots=True)
 class LoginSession:
     """A login session tracking authentication state."""
 
@@ -62,56 +67,76 @@ class LoginSession:
         return time.time() > self.expires_at
 
 
+@dataclass
+class _SessionShard:
+    """One lock-striped partition of the session table."""
+
+    sessions: dict[str, LoginSession] = field(default_factory=dict)
+    lock: Lock = field(default_factory=Lock)
+    # Min-heap of (expires_at, session_id); may hold ids already removed.
+    expiry_heap: list[tuple[float, str]] = field(default_factory=list)
+
+
 class LoginSessionManager:
     """
     Manages login sessions with expiry and cleanup.
 
     Thread-safe singleton for managing active login sessions.
     Sessions expire after 5 minutes of inactivity.
+
+    Sessions are striped across ``SHARD_COUNT`` independently locked dicts so
+    that polling one session never contends with operations on another.
     """
 
+    SHARD_COUNT = 16  # Must be a power of two (shard index is a bit mask)
+
     _instance: "LoginSessionManager | None" = None
     _class_lock = Lock()
 
     # Instance attributes (declared for type checker)
-    _sessions: dict[str, LoginSession]
-    _sessions_lock: Lock
+    _shards: list[_SessionShard]
 
     def __new__(cls) -> "LoginSessionManager":
         if cls._instance is None:
             with cls._class_lock:
                 if cls._instance is None:
                     instance = super().__new__(cls)
-                    instance._sessions = {}
-                    instance._sessions_lock = Lock()
+                    instance._shards = [_SessionShard() for _ in range(cls.SHARD_COUNT)]
                     cls._instance = instance
         return cls._instance
 
+    def _shard(self, session_id: str) -> _SessionShard:
+        """Return the shard owning *session_id*."""
+        return self._shards[hash(session_id) & (self.SHARD_COUNT - 1)]
+
     def create_session(self, account: str) -> LoginSession:
         """Create a new login session."""
-        session_id = str(uuid.uuid4())
+        session_id = token_urlsafe(16)
+        now = time.time()
         session = LoginSession(
             session_id=session_id,
             account=account,
             state=LoginState.INITIALIZED,
-            created_at=time.time(),
+            created_at=now,
         )
-        with self._sessions_lock:
-            # Cleanup expired sessions while we're at it
-            self._cleanup_expired_unlocked()
-            self._sessions[session_id] = session
+        # Cleanup expired sessions while we're at it
+        self._cleanup_expired(now=now)
+        shard = self._shard(session_id)
+        with shard.lock:
+            shard.sessions[session_id] = session
+            heapq.heappush(shard.expiry_heap, (session.expires_at, session_id))
         return session
 
     def get_session(self, session_id: str) -> LoginSession | None:
         """Get a session by ID, returning None if not found or expired."""
-        with self._sessions_lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return None
-            if session.is_expired:
-                self._remove_session_unlocked(session_id)
-                return None
-            return session
+        now = time.time()
+        shard = self._shard(session_id)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
+            if session is None or session.expires_at >= now:
+                return session
+            self._remove_session_unlocked(shard, session_id)
+            return None
 
     def update_state(
         self,
@@ -123,9 +148,9 @@ class LoginSessionManager:
         twofa_method: str | None = None,
     ) -> LoginSession | None:
         """Update the state of a session."""
-        with self._sessions_lock:
-            session = self._sessions.get(session_id)
-            if session is None:
+        shard = self._shard(session_id)
+        with shard.lock:
+            if (session := shard.sessions.get(session_id)) is None:
                 return None
             session.state = state
             if error_message is not None:
@@ -140,44 +165,58 @@ class LoginSessionManager:
 
     def set_fetcher(self, session_id: str, fetcher: LoginFetcher) -> None:
         """Attach a fetcher to a session."""
-        with self._sessions_lock:
-            session = self._sessions.get(session_id)
-            if session:
+        shard = self._shard(session_id)
+        with shard.lock:
+            if (session := shard.sessions.get(session_id)) is not None:
                 session._fetcher = fetcher
 
     def get_fetcher(self, session_id: str) -> LoginFetcher | None:
         """Get the fetcher for a session."""
-        with self._sessions_lock:
-            session = self._sessions.get(session_id)
+        shard = self._shard(session_id)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
             return session._fetcher if session else None
 
     def remove_session(self, session_id: str) -> LoginSession | None:
         """Remove a session and return it."""
-        with self._sessions_lock:
-            return self._remove_session_unlocked(session_id)
+        shard = self._shard(session_id)
+        with shard.lock:
+            return self._remove_session_unlocked(shard, session_id)
 
-    def _remove_session_unlocked(self, session_id: str) -> LoginSession | None:
-        """Remove a session without locking (caller must hold lock).
+    def _remove_session_unlocked(
+        self, shard: _SessionShard, session_id: str
+    ) -> LoginSession | None:
+        """Remove a session from its shard (caller must hold the shard lock).
 
         Note: Callers should close the fetcher (await fetcher.close()) before
         calling this method, as the fetcher's close() is async and cannot be
         called from this sync context.
         """
-        session = self._sessions.pop(session_id, None)
+        session = shard.sessions.pop(session_id, None)
         # Clear the fetcher reference (caller is responsible for closing it)
         if session and session._fetcher:
             session._fetcher = None
         return session
 
-    def _cleanup_expired_unlocked(self) -> int:
-        """Remove expired sessions (caller must hold lock)."""
-        now = time.time()
-        expired = [
-            sid for sid, session in self._sessions.items() if session.expires_at < now
-        ]
-        for sid in expired:
-            self._remove_session_unlocked(sid)
-        return len(expired)
+    def _cleanup_expired(self, now: float | None = None) -> int:
+        """Remove expired sessions, locking each shard in turn.
+
+        Only the expired prefix of each shard's expiry heap is visited, so the
+        cost scales with the number of expired sessions, not live ones.
+        """
+        if now is None:
+            now = time.time()
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                heap = shard.expiry_heap
+                while heap and heap[0][0] < now:
+                    _, sid = heapq.heappop(heap)
+                    session = shard.sessions.get(sid)
+                    if session is not None and session.expires_at < now:
+                        self._remove_session_unlocked(shard, sid)
+                        removed += 1
+        return removed
 
 
 # Global instance
@@ -11,11 +11,12 @@ password_hash)`` so rotating either the password *or* the secret
 invalidates all sessions.
 """
 
+import functools
 import hashlib
 import hmac
+import html
 import os
 import secrets
-import string
 from pathlib import Path
 from urllib.parse import quote
 
@@ -38,13 +39,22 @@ EXEMPT_PREFIXES = ("/site-auth/", "/health")
 EXEMPT_PATHS = frozenset({"/webhooks/github/push"})
 
 
+@functools.cache
 def _get_server_secret() -> bytes:
-    """Return (and lazily create) a persistent 32-byte server secret."""
+    """Return (and lazily create) a persistent 32-byte server secret.
+
+    The secret never changes while the server runs, so the file is only
+    touched on the first call.
+    """
     AUTH_STATE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
     AUTH_STATE_DIR.chmod(0o700)
-    if SECRET_KEY_FILE.exists():
+    try:
+        secret = SECRET_KEY_FILE.read_bytes()
+    except FileNotFoundError:
+        pass
+    else:
         SECRET_KEY_FILE.chmod(0o600)
-        return SECRET_KEY_FILE.read_bytes()
+        return secret
     secret = secrets.token_bytes(32)
     SECRET_KEY_FILE.write_bytes(secret)
     SECRET_KEY_FILE.chmod(0o600)
@@ -66,6 +76,13 @@ def _signing_key(server_secret: bytes, pw_hash: bytes) -> bytes:
     return hmac.new(server_secret, pw_hash, "sha256").digest()
 
 
+@functools.cache
+def _cached_signing_key(password: str) -> bytes:
+    """Signing key for *password*, running the PBKDF2 derivation once per process."""
+    secret = _get_server_secret()
+    return _signing_key(secret, _password_hash(password, secret))
+
+
 def _make_serializer(signing_key: bytes) -> URLSafeTimedSerializer:
     return URLSafeTimedSerializer(signing_key)
 
@@ -87,35 +104,58 @@ class SiteAuthMiddleware:
         )
 
         if self._password:
-            secret = _get_server_secret()
-            pw_hash = _password_hash(self._password, secret)
-            self._signing_key = _signing_key(secret, pw_hash)
+            self._signing_key = _cached_signing_key(self._password)
         else:
             self._signing_key = b""
+        # The signing key is fixed for the process lifetime, so build the
+        # serializer once rather than per request.
+        self._serializer: URLSafeTimedSerializer | None = (
+            _make_serializer(self._signing_key) if self._password else None
+        )
+        self._cookie_needle = f"{COOKIE_NAME}=".encode()
+        # Constant body and headers; Response carries no per-request state, so
+        # one instance can answer every unauthenticated API call.
+        self._unauth_json_response = Response(
+            content='{"detail":"Site authentication required"}',
+            status_code=401,
+            media_type="application/json",
+        )
 
-    # -- helpers ------------------------------------------------------------
+        # Auth is either on or off for the whole process, so pick the request
+        # handler once.  Python looks up __call__ on the type, which is why
+        # __call__ forwards here rather than being reassigned per instance.
+        if not self._password or self._test_mode:
+            self._handle = self.app
+        else:
+            self._handle = self._enforce
 
-    def _is_exempt(self, path: str) -> bool:
-        if path in EXEMPT_PATHS:
-            return True
-        for prefix in EXEMPT_PREFIXES:
-            if path.startswith(prefix):
-                return True
-        return False
+    # -- helpers ------------------------------------------------------------
 
-    def _cookie_from_headers(self, headers: list[tuple[bytes, bytes]]) -> str | None:
+    def _scan_headers(
+        self, headers: list[tuple[bytes, bytes]]
+    ) -> tuple[str | None, bool]:
+        """Return ``(site_cookie, wants_html)`` from a single pass over *headers*."""
+        cookie: str | None = None
+        accept: bytes | None = None
         for key, value in headers:
             if key == b"cookie":
-                for part in value.decode().split(";"):
-                    part = part.strip()
-                    if part.startswith(f"{COOKIE_NAME}="):
-                        return part[len(COOKIE_NAME) + 1 :]
-        return None
+                if cookie is None:
+                    # Stay in bytes: only the matching cookie gets decoded.
+                    for part in value.split(b";"):
+                        part = part.lstrip()
+                        if part.startswith(self._cookie_needle):
+                            cookie = part[len(self._cookie_needle) :].rstrip().decode()
+                            break
+            elif key == b"accept":
+                if accept is None:
+                    accept = value
+        return cookie, accept is not None and b"text/html" in accept
 
     def _is_authenticated(self, cookie_value: str) -> bool:
+        if self._serializer is None:
+            return False
         try:
-            serializer = _make_serializer(self._signing_key)
-            serializer.loads(cookie_value, max_age=COOKIE_MAX_AGE)
+            self._serializer.loads(cookie_value, max_age=COOKIE_MAX_AGE)
             return True
         except (BadSignature, SignatureExpired):
             return False
@@ -127,28 +167,19 @@ class SiteAuthMiddleware:
             and scope.get("server") is None
         )
 
-    @staticmethod
-    def _wants_html(headers: list[tuple[bytes, bytes]]) -> bool:
-        for key, value in headers:
-            if key == b"accept":
-                return b"text/html" in value
-        return False
-
     # -- ASGI ---------------------------------------------------------------
 
-    async def __call__(self, scope, receive, send):
-        if scope["type"] != "http":
-            await self.app(scope, receive, send)
-            return
+    def __call__(self, scope, receive, send):
+        return self._handle(scope, receive, send)
 
-        # Bypass when no password configured or in test mode
-        if not self._password or self._test_mode:
+    async def _enforce(self, scope, receive, send):
+        if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
         path: str = scope.get("path", "/")
 
-        if self._is_exempt(path):
+        if path in EXEMPT_PATHS or path.startswith(EXEMPT_PREFIXES):
             await self.app(scope, receive, send)
             return
 
@@ -158,21 +189,17 @@ class SiteAuthMiddleware:
 
         # Check cookie
         headers = scope.get("headers", [])
-        cookie = self._cookie_from_headers(headers)
+        cookie, wants_html = self._scan_headers(headers)
         if cookie and self._is_authenticated(cookie):
             await self.app(scope, receive, send)
             return
 
         # Not authenticated — respond appropriately
-        if self._wants_html(headers):
+        if wants_html:
             redirect_url = f"/site-auth/login?next={quote(path, safe='')}"
             response = RedirectResponse(url=redirect_url, status_code=302)
         else:
-            response = Response(
-                content='{"detail":"Site authentication required"}',
-                status_code=401,
-                media_type="application/json",
-            )
+            response = self._unauth_json_response
 
         await response(scope, receive, send)
 
@@ -181,7 +208,7 @@ class SiteAuthMiddleware:
 # FastAPI router for login / logout
 # ---------------------------------------------------------------------------
 
-_LOGIN_TEMPLATE = string.Template("""\
+_LOGIN_TEMPLATE = """\
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -221,7 +248,32 @@ _LOGIN_TEMPLATE = string.Template("""\
 </div>
 </body>
 </html>
-""")
+"""
+
+
+def _split_template(template: str, names: tuple[str, ...]) -> tuple[str, ...]:
+    """Split *template* around its ``$name`` placeholders, in *names* order."""
+    parts = []
+    for name in names:
+        head, template = template.split(f"${name}", 1)
+        parts.append(head)
+    parts.append(template)
+    return tuple(parts)
+
+
+# Split once at import so rendering is a plain join rather than a regex scan.
+_LOGIN_TEMPLATE_PARTS = _split_template(
+    _LOGIN_TEMPLATE, ("warning", "error", "next_url")
+)
+
+
+def _render_login_page(*, warning: str, error: str, next_url: str) -> bytes:
+    """Render the login form as UTF-8, escaping the caller-supplied *next_url*."""
+    head, after_warning, after_error, tail = _LOGIN_TEMPLATE_PARTS
+    next_url = html.escape(next_url, quote=True)
+    body = "".join((head, warning, after_warning, error, after_error, next_url, tail))
+    return body.encode()
+
 
 router = APIRouter(prefix="/site-auth", tags=["site-auth"])
 
@@ -242,12 +294,12 @@ def _warning_banner(request: Request) -> str:
 
 @router.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request, next: str = "/"):
-    html = _LOGIN_TEMPLATE.substitute(
+    body = _render_login_page(
         next_url=next,
         error="",
         warning=_warning_banner(request),
     )
-    return HTMLResponse(content=html)
+    return HTMLResponse(content=body)
 
 
 @router.post("/login")
@@ -258,17 +310,15 @@ async def login_submit(request: Request):
 
     site_password = os.environ.get("GHINBOX_SITE_PASSWORD", "")
     if not site_password or not hmac.compare_digest(str(password), site_password):
-        html = _LOGIN_TEMPLATE.substitute(
-            next_url=next_url,
+        body = _render_login_page(
+            next_url=str(next_url),
             error='<p class="error">Incorrect password.</p>',
             warning=_warning_banner(request),
         )
-        return HTMLResponse(content=html, status_code=403)
+        return HTMLResponse(content=body, status_code=403)
 
     # Build signed cookie
-    secret = _get_server_secret()
-    pw_hash = _password_hash(site_password, secret)
-    key = _signing_key(secret, pw_hash)
+    key = _cached_signing_key(site_password)
     serializer = _make_serializer(key)
     token = serializer.dumps({"ok": True})
 
@@ -20,15 +20,53 @@ from __future__ import annotations
 
 import time
 import urllib.parse
-from datetime import datetime, timezone
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from urllib.parse import urlparse
 
-from playwright.sync_api import sync_playwright, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import Page, sync_playwright
 
 from ghinbox.flows.base import BaseFlow
 from ghinbox.github_api import save_response, RESPONSES_DIR
-from ghinbox.parser.notifications import parse_notifications_html
+from ghinbox.parser.notifications import (
+    SessionExpiredError,
+    parse_first_notification_html,
+)
+
+_SEP = "=" * 60
+
+# GitHub advertises X-Poll-Interval: 60 on /notifications, far longer than a
+# flow waiting on its own action can afford, so polls back off from one second
+# up to this cap instead; unchanged polls are 304s, which cost no quota.
+MAX_POLL_DELAY_SECONDS = 3.0
+
+# updated_at is GitHub's clock truncated to the second; local action times are
+# widened by this much so same-second updates and modest clock skew still count.
+CLOCK_SKEW_SECONDS = 5
+
+# The list container (or the empty-state box) marks a rendered notifications
+# page; matching it is cheaper than rescanning every list item per mutation.
+NOTIFICATIONS_READY_SELECTOR = ".js-notifications-list, .blankslate"
+
+
+def _poll_delay(attempt: int) -> float:
+    """Seconds to sleep before retry *attempt* (1-based): 1, 2, then the cap."""
+    return min(2.0 ** (attempt - 1), MAX_POLL_DELAY_SECONDS)
+
+
+@dataclass(slots=True, frozen=True)
+class AnchorSnapshot:
+    """Notification link state seen by one capture."""
+
+    label: str
+    anchor: str
+    unread: bool | None = None
+    url: str | None = None
+    found_in_view: str | None = None
 
 
 class AnchorTrackingFlow(BaseFlow):
@@ -37,212 +75,301 @@ class AnchorTrackingFlow(BaseFlow):
     name = "anchor_tracking"
     description = "Track notification anchor changes to understand read state"
 
+    def __init__(
+        self,
+        owner_account: str,
+        trigger_account: str,
+        headless: bool = True,
+        cleanup: bool = True,
+    ):
+        super().__init__(owner_account, trigger_account, headless, cleanup)
+        # (full_url, unread) of the last capture whose HTML/PNG were written
+        self._last_capture: tuple[str, bool] | None = None
+        self._last_capture_label: str | None = None
+        # Artifact writes (HTML, PNG, JSON) run here, off the capture path
+        self._io_pool: ThreadPoolExecutor | None = None
+        self._pending_writes: list[Future[Any]] = []
+        # Trigger-account comment POSTs, kept apart so they never queue
+        # behind artifact writes
+        self._api_pool: ThreadPoolExecutor | None = None
+        # (view name, notifications URL) in priority order, set once the test
+        # repo exists
+        self._view_urls: list[tuple[str, str]] = []
+        # View the last capture found the notification in
+        self._last_found_view: str | None = None
+
     def run(self) -> bool:
         """Run the anchor tracking test."""
         if not self.validate_prerequisites():
             return False
 
+        # Artifact writes below assume the directory exists
+        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
+
         try:
             if not self.setup_test_repo():
                 return False
 
-            # Step 1: B creates issue
-            print(f"\n{'=' * 60}")
-            print("Step 1: B creates issue")
-            print(f"{'=' * 60}")
-
-            issue = self.create_test_issue()
-            issue_number = issue.get("number")
-            if not isinstance(issue_number, int):
-                print("ERROR: Issue number missing")
-                return False
-
-            # Wait for notification
-            notification = self.wait_for_notification()
-            if not notification:
-                print("ERROR: Notification not found")
-                return False
-
-            # Capture initial state (no anchor expected)
-            anchor_1 = self._capture_notification_anchor("step1_initial")
-
-            # Step 2: A reads it (views issue page)
-            print(f"\n{'=' * 60}")
-            print("Step 2: A reads notification (visiting issue page)")
-            print(f"{'=' * 60}")
+            repo_query = f"repo:{self.owner_username}/{self.repo_name}"
+            self._view_urls = [
+                (
+                    view_name,
+                    "https://github.com/notifications?query="
+                    + urllib.parse.quote(query),
+                )
+                for view_name, query in [
+                    ("inbox", repo_query),
+                    ("all", f"{repo_query} is:all"),
+                    ("unread", f"{repo_query} is:unread"),
+                ]
+            ]
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
-                if context is None:
-                    print("Failed to create browser context")
-                    return False
+            self._io_pool = ThreadPoolExecutor(max_workers=2)
+            self._api_pool = ThreadPoolExecutor(max_workers=1)
+            try:
+                # One browser for the whole flow; each step opens its own context.
+                with sync_playwright() as p:
+                    self.start_browser(p)
+                    try:
+                        return self._run_steps()
+                    finally:
+                        self.stop_browser()
+            finally:
+                self._api_pool.shutdown(wait=True)
+                self._api_pool = None
+                self._drain_writes()
 
-                page = context.new_page()
-                self._visit_issue_page(page, issue_number)
+        finally:
+            self.cleanup_test_repo()
 
-                if context.browser:
-                    context.browser.close()
+    def _run_steps(self) -> bool:
+        """Run the numbered steps against the shared browser."""
+        # Step 1: B creates issue
+        print(f"\n{_SEP}\nStep 1: B creates issue\n{_SEP}")
 
-            time.sleep(3)
-            anchor_2 = self._capture_notification_anchor("step2_after_read")
+        issue = self.create_test_issue()
+        issue_number = issue.get("number")
+        if not isinstance(issue_number, int):
+            print("ERROR: Issue number missing")
+            return False
 
-            # Step 3: A marks notification as done
-            print(f"\n{'=' * 60}")
-            print("Step 3: A marks notification as DONE")
-            print(f"{'=' * 60}")
+        # Wait for notification
+        notification = self.wait_for_notification()
+        if not notification:
+            print("ERROR: Notification not found")
+            return False
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
-                if context is None:
-                    print("Failed to create browser context")
-                    return False
+        # Capture initial state (no anchor expected)
+        anchor_1 = self._capture_notification_anchor("step1_initial")
 
-                page = context.new_page()
-                self._mark_as_done(page)
+        # Step 2: A reads it (views issue page)
+        print(f"\n{_SEP}\nStep 2: A reads notification (visiting issue page)\n{_SEP}")
 
-                if context.browser:
-                    context.browser.close()
+        since = datetime.now(timezone.utc)
+        self._visit_issue_page(issue_number)
 
-            time.sleep(3)
-            anchor_3 = self._capture_notification_anchor("step3_after_done")
+        self._wait_for_notification_update(
+            since, until=lambda n: n is not None and not n.get("unread")
+        )
+        anchor_2 = self._capture_notification_anchor("step2_after_read")
 
-            # Step 4: B adds a comment - should trigger notification with anchor
-            print(f"\n{'=' * 60}")
-            print("Step 4: B adds first comment (after A marked done)")
-            print(f"{'=' * 60}")
+        # Step 3: A marks notification as done
+        print(f"\n{_SEP}\nStep 3: A marks notification as DONE\n{_SEP}")
 
-            assert self.trigger_api is not None
-            comment1 = self.trigger_api.create_issue_comment(
-                self.owner_username,
-                self.repo_name,
-                issue_number,
-                f"First comment after done - {datetime.now(timezone.utc).isoformat()}",
-            )
-            print(f"Comment 1 ID: {comment1.get('id')}")
+        since = datetime.now(timezone.utc)
+        self._mark_as_done()
 
-            # Wait for notification to reappear via API
-            print("Waiting for notification to reappear...")
-            self._wait_for_notification_reappear()
+        # Done threads drop out of the API listing entirely.
+        self._wait_for_notification_update(since, until=lambda n: n is None)
+        anchor_3 = self._capture_notification_anchor("step3_after_done")
 
-            # This is the key capture - should have anchor!
-            anchor_4 = self._capture_notification_anchor("step4_after_comment1")
+        # Step 4: B adds a comment - should trigger notification with anchor
+        print(f"\n{_SEP}\nStep 4: B adds first comment (after A marked done)\n{_SEP}")
 
-            # Step 5: A reads it again
-            print(f"\n{'=' * 60}")
-            print("Step 5: A reads notification again")
-            print(f"{'=' * 60}")
+        since = datetime.now(timezone.utc)
+        comment_future = self._submit_comment(
+            issue_number,
+            f"First comment after done - {datetime.now(timezone.utc).isoformat()}",
+        )
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
-                if context is None:
-                    print("Failed to create browser context")
-                    return False
+        # Wait for notification to reappear via API; A's first poll overlaps
+        # B's POST, and each token still has only one request in flight.
+        print("Waiting for notification to reappear...")
+        self._wait_for_notification_update(
+            since, until=lambda n: n is not None, timeout=24
+        )
+        comment1 = comment_future.result()
+        print(f"Comment 1 ID: {comment1.get('id')}")
 
-                page = context.new_page()
-                self._visit_issue_page(page, issue_number)
+        # This is the key capture - should have anchor!
+        anchor_4 = self._capture_notification_anchor("step4_after_comment1")
 
-                if context.browser:
-                    context.browser.close()
+        # Step 5: A reads it again
+        print(f"\n{_SEP}\nStep 5: A reads notification again\n{_SEP}")
 
-            time.sleep(3)
-            anchor_5 = self._capture_notification_anchor("step5_after_read2")
+        since = datetime.now(timezone.utc)
+        self._visit_issue_page(issue_number)
 
-            # Step 6: B adds another comment
-            print(f"\n{'=' * 60}")
-            print("Step 6: B adds second comment")
-            print(f"{'=' * 60}")
+        self._wait_for_notification_update(
+            since, until=lambda n: n is not None and not n.get("unread")
+        )
+        anchor_5 = self._capture_notification_anchor("step5_after_read2")
 
-            comment2 = self.trigger_api.create_issue_comment(
-                self.owner_username,
-                self.repo_name,
-                issue_number,
-                f"Second comment - {datetime.now(timezone.utc).isoformat()}",
-            )
-            print(f"Comment 2 ID: {comment2.get('id')}")
-            time.sleep(5)
-
-            anchor_6 = self._capture_notification_anchor("step6_after_comment2")
-
-            # Analysis
-            print(f"\n{'=' * 60}")
-            print("ANALYSIS: Anchor Progression")
-            print(f"{'=' * 60}")
-
-            self._analyze_anchors(
-                [
-                    ("1. Initial (issue created)", anchor_1),
-                    ("2. After A reads", anchor_2),
-                    ("3. After A marks done", anchor_3),
-                    ("4. After B adds comment1 (KEY)", anchor_4),
-                    ("5. After A reads again", anchor_5),
-                    ("6. After B adds comment2", anchor_6),
-                ],
-                [comment1.get("id"), comment2.get("id")],
-            )
+        # Step 6: B adds another comment
+        print(f"\n{_SEP}\nStep 6: B adds second comment\n{_SEP}")
 
-            return True
+        since = datetime.now(timezone.utc)
+        comment_future = self._submit_comment(
+            issue_number, f"Second comment - {datetime.now(timezone.utc).isoformat()}"
+        )
+        self._wait_for_notification_update(since)
+        comment2 = comment_future.result()
+        print(f"Comment 2 ID: {comment2.get('id')}")
+
+        anchor_6 = self._capture_notification_anchor("step6_after_comment2")
+
+        # Analysis
+        print(f"\n{_SEP}\nANALYSIS: Anchor Progression\n{_SEP}")
+
+        self._analyze_anchors(
+            [
+                ("1. Initial (issue created)", anchor_1),
+                ("2. After A reads", anchor_2),
+                ("3. After A marks done", anchor_3),
+                ("4. After B adds comment1 (KEY)", anchor_4),
+                ("5. After A reads again", anchor_5),
+                ("6. After B adds comment2", anchor_6),
+            ],
+            [comment1.get("id"), comment2.get("id")],
+        )
 
-        finally:
-            self.cleanup_test_repo()
+        return True
+
+    def _write_in_background(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Queue an artifact write on the I/O pool (inline if there is none)."""
+        if self._io_pool is None:
+            fn(*args)
+            return
+        self._pending_writes.append(self._io_pool.submit(fn, *args))
+
+    def _drain_writes(self) -> None:
+        """Wait for queued artifact writes and report any that failed."""
+        if self._io_pool is None:
+            return
+        self._io_pool.shutdown(wait=True)
+        for future in self._pending_writes:
+            if (exc := future.exception()) is not None:
+                print(f"WARNING: Failed to save artifact: {exc}")
+        self._io_pool = None
+        self._pending_writes = []
+
+    def _submit_comment(self, issue_number: int, body: str) -> Future[Any]:
+        """Start posting a comment as B on the API pool and return its future.
+
+        Callers start A's notification wait before joining the future, so the
+        POST overlaps A's first poll.  The two use different accounts, so no
+        token ever has concurrent requests in flight (GitHub's secondary rate
+        limits are per user).
+        """
+        assert self.trigger_api is not None
+        assert self._api_pool is not None
+        return self._api_pool.submit(
+            self.trigger_api.create_issue_comment,
+            self.owner_username,
+            self.repo_name,
+            issue_number,
+            body,
+        )
 
-    def _capture_notification_anchor(self, label: str) -> dict[str, Any]:
+    def _iter_view_pages(self, first_page: Page) -> Iterator[tuple[str, Page]]:
+        """Yield ``(view name, loaded page)`` for each notifications view.
+
+        Views always come in inbox -> all -> unread order: they overlap (``all``
+        is a superset of the inbox), so the order decides which one a capture
+        reports.  When the last capture found the notification in the inbox,
+        the inbox is loaded and yielded on its own and the others are only
+        navigated if the caller keeps iterating.  Within a batch every
+        navigation starts before any is waited on, so the browser loads them in
+        parallel.
+        """
+        views = self._view_urls
+        if self._last_found_view == "inbox":
+            batches = [views[:1], views[1:]]
+        else:
+            batches = [views]
+        for batch in batches:
+            pages = [first_page] + [first_page.context.new_page() for _ in batch[1:]]
+            for page, (_, url) in zip(pages, batch):
+                page.goto(url, wait_until="commit")
+
+            for (view_name, _), page in zip(batch, pages):
+                page.wait_for_load_state("domcontentloaded")
+                # A login redirect never renders the list, so catch it before
+                # waiting on the selector; the <main> subtree read later has
+                # none of the body markers is_login_page looks for.
+                if urlparse(page.url).path.startswith("/login"):
+                    raise SessionExpiredError(
+                        "GitHub session has expired. Please re-authenticate."
+                    )
+                page.wait_for_selector(
+                    NOTIFICATIONS_READY_SELECTOR, state="attached", timeout=10000
+                )
+                # A blankslate may just be the SPA still swapping in the list;
+                # only then give the network a moment to settle.
+                if page.locator(".notifications-list-item").count() == 0:
+                    try:
+                        page.wait_for_load_state("networkidle", timeout=2000)
+                    except PlaywrightTimeoutError:
+                        pass
+                yield view_name, page
+
+    def _capture_notification_anchor(self, label: str) -> AnchorSnapshot:
         """Capture the notification HTML and extract the anchor."""
-        with sync_playwright() as p:
-            context = self.create_browser_context(p)
-            if context is None:
-                return {"error": "Failed to create browser context"}
-
-            page = context.new_page()
-            RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
-
-            # Try multiple views to find the notification
-            views = [
-                ("inbox", f"repo:{self.owner_username}/{self.repo_name}"),
-                ("all", f"repo:{self.owner_username}/{self.repo_name} is:all"),
-                ("unread", f"repo:{self.owner_username}/{self.repo_name} is:unread"),
-            ]
-
+        with self.owner_page() as first_page:
             result: dict[str, Any] = {
                 "label": label,
                 "notification_count": 0,
                 "views_checked": [],
             }
 
-            for view_name, query in views:
-                url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
-                page.goto(url, wait_until="domcontentloaded")
-                page.locator(".notifications-list-item, .blankslate").first.wait_for(
-                    state="attached", timeout=10000
-                )
-                time.sleep(1)
+            # Views are read in probe order and the first non-empty one wins
+            for view_name, page in self._iter_view_pages(first_page):
+                # The list lives under <main>; pulling just that subtree avoids
+                # shipping the whole document (scripts, SVGs) over CDP.
+                main_html = page.locator("main").first.inner_html()
+                html_content = f"<html><body><main>{main_html}</main></body></html>"
 
-                html_content = page.content()
+                # Only the top notification is inspected, so skip the rest
+                notif, count = parse_first_notification_html(html_content)
 
-                # Parse HTML
-                parsed = parse_notifications_html(
-                    html=html_content,
-                    owner=self.owner_username,
-                    repo=self.repo_name,
-                    source_url=url,
-                )
-
-                result["views_checked"].append(
-                    {"view": view_name, "count": len(parsed.notifications)}
-                )
+                result["views_checked"].append({"view": view_name, "count": count})
 
-                if parsed.notifications:
-                    notif = parsed.notifications[0]
+                if notif is not None:
                     full_url = notif.subject.url
                     parsed_url = urlparse(full_url)
 
-                    result["notification_count"] = len(parsed.notifications)
+                    result["notification_count"] = count
                     result["full_url"] = full_url
                     result["anchor"] = parsed_url.fragment or "(no anchor)"
                     result["unread"] = notif.unread
                     result["found_in_view"] = view_name
-
-                    save_response(f"anchor_{label}_html", html_content, "html")
-                    page.screenshot(path=str(RESPONSES_DIR / f"anchor_{label}.png"))
+                    self._last_found_view = view_name
+
+                    # Only persist the page artifacts when the anchor state moved
+                    capture = (full_url, notif.unread)
+                    if capture == self._last_capture:
+                        result["unchanged"] = True
+                        result["ref_label"] = self._last_capture_label
+                    else:
+                        png = page.screenshot()
+                        self._write_in_background(
+                            save_response, f"anchor_{label}_html", html_content, "html"
+                        )
+                        self._write_in_background(
+                            (RESPONSES_DIR / f"anchor_{label}.png").write_bytes, png
+                        )
+                        self._last_capture = capture
+                        self._last_capture_label = label
 
                     print(f"  [{label}] Found in '{view_name}' view")
                     print(f"  [{label}] URL: {full_url}")
@@ -251,17 +378,21 @@ class AnchorTrackingFlow(BaseFlow):
                     break
             else:
                 # Not found in any view
+                self._last_found_view = None
                 result["anchor"] = "(no notification found)"
                 print(f"  [{label}] No notification found in any view")
                 print(f"  [{label}] Views checked: {result['views_checked']}")
 
-            if context.browser:
-                context.browser.close()
-
-            save_response(f"anchor_{label}", result, "json")
-            return result
+        self._write_in_background(save_response, f"anchor_{label}", result, "json")
+        return AnchorSnapshot(
+            label=label,
+            anchor=result["anchor"],
+            unread=result.get("unread"),
+            url=result.get("full_url"),
+            found_in_view=result.get("found_in_view"),
+        )
 
-    def _visit_issue_page(self, page: Page, issue_number: int) -> None:
+    def _visit_issue_page(self, issue_number: int) -> None:
         """Visit the issue page to mark notification as read."""
         issue_url = (
             f"https://github.com/{self.owner_username}/{self.repo_name}"
@@ -269,79 +400,121 @@ class AnchorTrackingFlow(BaseFlow):
         )
         print(f"Visiting: {issue_url}")
 
-        page.goto(issue_url, wait_until="domcontentloaded")
-        page.locator(".js-issue-title, .markdown-body").first.wait_for(
-            state="attached", timeout=10000
-        )
+        with self.owner_page() as page:
+            page.goto(issue_url, wait_until="domcontentloaded")
+            page.locator(".js-issue-title, .markdown-body").first.wait_for(
+                state="attached", timeout=10000
+            )
 
-        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
-        page.screenshot(path=str(RESPONSES_DIR / "anchor_issue_page.png"))
+            png = page.screenshot()
+        self._write_in_background(
+            (RESPONSES_DIR / "anchor_issue_page.png").write_bytes, png
+        )
         print("Issue page loaded")
 
-    def _wait_for_notification_reappear(
-        self, max_attempts: int = 10, wait_seconds: int = 3
+    def _find_repo_notification(
+        self, notifications: list[Any]
+    ) -> dict[str, Any] | None:
+        """Return the API notification for the test repo, if listed."""
+        for notif in notifications:
+            if notif.get("repository", {}).get("name") == self.repo_name:
+                return notif
+        return None
+
+    def _wait_for_notification_update(
+        self,
+        since: datetime,
+        until: Callable[[dict[str, Any] | None], bool] | None = None,
+        timeout: float = 15,
     ) -> bool:
-        """Wait for the notification to reappear after new activity."""
+        """Poll the API until the test repo's notification reflects an action.
+
+        *since* is when the action started (local clock); by default the wait
+        ends once the notification's ``updated_at`` reaches it, give or take
+        ``CLOCK_SKEW_SECONDS``.  After the first poll each
+        request sends ``If-None-Match`` with the previous ``ETag``.  The ETag
+        covers the body, so read/done flips that leave ``updated_at`` (and
+        ``Last-Modified``) alone still come back as 200s, while unchanged polls
+        are 304s with no body to re-check.
+        """
         assert self.owner_api is not None
 
-        for attempt in range(max_attempts):
-            if attempt > 0:
-                print(f"  Attempt {attempt + 1}/{max_attempts}...")
-                time.sleep(wait_seconds)
+        threshold = since.replace(microsecond=0) - timedelta(seconds=CLOCK_SKEW_SECONDS)
 
-            notifications = self.owner_api.get_notifications(all_notifications=True)
-            for notif in notifications:
-                if notif.get("repository", {}).get("name") == self.repo_name:
-                    print(f"  Notification found! Unread: {notif.get('unread')}")
+        def updated_after_since(notif: dict[str, Any] | None) -> bool:
+            if notif is None or not notif.get("updated_at"):
+                return False
+            return datetime.fromisoformat(notif["updated_at"]) >= threshold
+
+        done = until or updated_after_since
+        deadline = time.monotonic() + timeout
+        etag: str | None = None
+        attempt = 0
+        while True:
+            notifications, headers = self.owner_api.poll_notifications(
+                all_notifications=True, if_none_match=etag
+            )
+            if notifications is not None:
+                etag = headers.get("ETag")
+                if done(self._find_repo_notification(notifications)):
                     return True
 
-        print("  Notification did not reappear")
-        return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"  Notification did not update within {timeout:g}s")
+                return False
+            attempt += 1
+            time.sleep(min(_poll_delay(attempt), remaining))
 
-    def _mark_as_done(self, page: Page) -> None:
+    def _mark_as_done(self) -> None:
         """Mark the notification as done."""
-        query = f"repo:{self.owner_username}/{self.repo_name}"
-        url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+        _, inbox_url = self._view_urls[0]
 
-        page.goto(url, wait_until="domcontentloaded")
-        page.locator(".notifications-list-item, .blankslate").first.wait_for(
-            state="attached", timeout=10000
-        )
+        with self.owner_page() as page:
+            page.goto(inbox_url, wait_until="domcontentloaded")
+            page.wait_for_selector(
+                NOTIFICATIONS_READY_SELECTOR, state="attached", timeout=10000
+            )
 
-        # Find and click checkbox, then Done button
-        notification_checkbox = page.locator(
-            f'.notifications-list-item:has(a[href*="{self.repo_name}"]) input[type="checkbox"]'
-        ).first
+            # Find and click checkbox, then Done button
+            notification_checkbox = page.locator(
+                f'.notifications-list-item:has(a[href*="{self.repo_name}"]) input[type="checkbox"]'
+            ).first
+
+            # check()/click() auto-wait for their targets, so a timeout doubles
+            # as the "not found" signal without a separate count() round-trip.
+            try:
+                notification_checkbox.check(timeout=2000)
+            except PlaywrightTimeoutError:
+                print("WARNING: Could not find notification to mark as done")
+                return
+
+            try:
+                page.locator('button:has-text("Done")').first.click(timeout=5000)
+            except PlaywrightTimeoutError:
+                print("WARNING: Could not find Done button")
+                return
 
-        if notification_checkbox.count() > 0:
-            notification_checkbox.check()
-            done_button = page.locator('button:has-text("Done")').first
-            done_button.wait_for(state="visible", timeout=5000)
-            done_button.click()
             page.locator(
                 f'.notifications-list-item:has(a[href*="{self.repo_name}"])'
             ).wait_for(state="hidden", timeout=10000)
             print("Marked notification as done")
-        else:
-            print("WARNING: Could not find notification to mark as done")
 
     def _analyze_anchors(
         self,
-        anchors: list[tuple[str, dict[str, Any]]],
+        anchors: list[tuple[str, AnchorSnapshot]],
         comment_ids: list[int | None],
     ) -> None:
         """Analyze the progression of anchors and validate expected behavior."""
         print("\nANCHOR PROGRESSION:")
         print("-" * 60)
 
-        for label, data in anchors:
-            anchor = data.get("anchor", "?")
-            unread = data.get("unread", "?")
-            found_in = data.get("found_in_view", "-")
+        for label, snapshot in anchors:
+            unread = "?" if snapshot.unread is None else snapshot.unread
             print(f"  {label}:")
-            print(f"    Anchor: {anchor}")
+            print(f"    Anchor: {snapshot.anchor}")
             print(f"    Unread: {unread}")
-            print(f"    View: {found_in}")
+            print(f"    View: {snapshot.found_in_view or '-'}")
 
         print("\nCOMMENT IDs (for reference):")
         print("-" * 60)
@@ -349,13 +522,11 @@ class AnchorTrackingFlow(BaseFlow):
             print(f"  Comment {i}: issuecomment-{cid}")
 
         # Validation
-        print("\n" + "=" * 60)
-        print("VALIDATION RESULTS")
-        print("=" * 60)
+        print(f"\n{_SEP}\nVALIDATION RESULTS\n{_SEP}")
 
         # Find the final anchor (step 6 - after second comment)
-        final_data = anchors[-1][1]
-        final_anchor = final_data.get("anchor", "")
+        _, final = anchors[-1]
+        final_anchor = final.anchor
         comment1_id = comment_ids[0]
         comment2_id = comment_ids[1] if len(comment_ids) > 1 else None
 
@@ -382,7 +553,7 @@ class AnchorTrackingFlow(BaseFlow):
             print(f"  Got:      {final_anchor}")
 
         # Check unread status
-        final_unread = final_data.get("unread")
+        final_unread = final.unread
         if final_unread is True:
             print("\n✓ Notification correctly marked as unread after new activity")
         elif final_unread is False:
@@ -2,14 +2,18 @@
 Base class for test flows.
 """
 
+import json
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
-from playwright.sync_api import BrowserContext
+from playwright.sync_api import Browser, BrowserContext, Page, StorageState
 
 from ghinbox.auth import create_authenticated_context, has_valid_auth
+from ghinbox.auth_common import get_auth_state_path
 from ghinbox.github_api import GitHubAPI
 from ghinbox.token import load_token
 
@@ -40,6 +44,11 @@ class BaseFlow(ABC):
         self.repo_name: str = ""
         self.created_repo: Any = None
 
+        # Shared browser and owner storage state for owner_page(), set by
+        # start_browser()
+        self._browser: Browser | None = None
+        self._owner_storage_state: StorageState | None = None
+
     def validate_prerequisites(self) -> bool:
         """Validate that required auth and tokens exist."""
         for account in [self.owner_account, self.trigger_account]:
@@ -210,6 +219,39 @@ class BaseFlow(ABC):
             playwright, self.owner_account, headless=self.headless
         )
 
+    def start_browser(self, playwright) -> None:
+        """Launch one browser to be shared by every owner_page() in the flow.
+
+        The owner's storage state is read once here and handed to each new
+        context from memory.
+        """
+        auth_path = get_auth_state_path(self.owner_account)
+        self._owner_storage_state = json.loads(auth_path.read_text())
+        self._browser = playwright.chromium.launch(headless=self.headless)
+
+    def stop_browser(self) -> None:
+        """Close the browser launched by start_browser()."""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+
+    @contextmanager
+    def owner_page(self) -> Iterator[Page]:
+        """Yield a page in a fresh owner-authenticated context on the shared browser.
+
+        Contexts are cheap compared to browser launches, so each action gets
+        its own context and only the context is closed afterwards.
+        """
+        assert self._browser is not None, "Must call start_browser first"
+        context = self._browser.new_context(
+            storage_state=self._owner_storage_state,
+            viewport={"width": 1280, "height": 800},
+        )
+        try:
+            yield context.new_page()
+        finally:
+            context.close()
+
     @abstractmethod
     def run(self) -> bool:
         """Run the test flow. Returns True if test passed."""
@@ -75,10 +75,17 @@ class GitHubAPI:
         method: str,
         endpoint: str,
         data: dict | None = None,
+        extra_headers: dict[str, str] | None = None,
     ) -> tuple[dict | list | None, Any]:
-        """Make an API request."""
+        """Make an API request.
+
+        A 304 Not Modified answer to a conditional request returns
+        ``(None, headers)`` instead of raising.
+        """
         url = self._url_for_endpoint(endpoint)
         headers = github_rest_headers(self.token)
+        if extra_headers:
+            headers.update(extra_headers)
 
         body = None
         if data is not None:
@@ -102,6 +109,8 @@ class GitHubAPI:
                     return None, response.headers
                 return json.loads(body.decode("utf-8")), response.headers
         except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None, e.headers
             error_body = e.read().decode("utf-8") if e.fp else ""
             print(f"API Error {e.code}: {e.reason}")
             print(f"  URL: {url}")
@@ -274,6 +283,28 @@ class GitHubAPI:
 
         return self._get_paginated_list("/notifications", params)
 
+    def poll_notifications(
+        self,
+        all_notifications: bool = False,
+        if_none_match: str | None = None,
+    ) -> tuple[list[Any] | None, Any]:
+        """Fetch the first page of notifications, conditionally.
+
+        Returns ``(None, headers)`` when GitHub answers 304 Not Modified, which
+        does not count against the rate limit.  The headers carry the ``ETag``
+        to send as *if_none_match* on the next poll.
+        """
+        params = {"per_page": "100"}
+        if all_notifications:
+            params["all"] = "true"
+        extra_headers = {"If-None-Match": if_none_match} if if_none_match else None
+        payload, headers = self._request_with_headers(
+            "GET",
+            self._with_params("/notifications", params),
+            extra_headers=extra_headers,
+        )
+        return (payload if isinstance(payload, list) else None), headers
+
     def get_notification_thread(self, thread_id: str) -> Any:
         """Get a specific notification thread."""
         return self.get(f"/notifications/threads/{thread_id}")
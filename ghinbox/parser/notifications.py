@@ -6,6 +6,7 @@ https://github.com/notifications?query=repo:owner/name
 """
 
 import re
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from urllib.parse import parse_qs, urljoin, urlparse
 
@@ -105,13 +106,43 @@ def parse_notifications_html(
     )
 
 
+def parse_first_notification_html(html: str) -> tuple[Notification | None, int]:
+    """
+    Parse only the first notification on a GitHub notifications page.
+
+    For callers that only need the top item: the whole document is still
+    parsed and every list item is still matched (and counted), but only items
+    up to the first valid notification are extracted, and pagination and the
+    authenticity token are skipped.
+
+    Args:
+        html: The raw HTML content of the notifications page
+
+    Returns:
+        The first notification (or None) and the number of listed items
+
+    Raises:
+        SessionExpiredError: If the HTML is a login page (session expired)
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    if is_login_page(soup):
+        raise SessionExpiredError("GitHub session has expired. Please re-authenticate.")
+
+    items = soup.select("li.notifications-list-item[data-notification-id]")
+    first = next(_iter_notification_items(items), None)
+    return first, len(items)
+
+
 def _parse_notification_items(soup: BeautifulSoup) -> list[Notification]:
     """Parse all notification list items from the page."""
-    notifications: list[Notification] = []
-
     # Find all notification list items
     items = soup.select("li.notifications-list-item[data-notification-id]")
+    return list(_iter_notification_items(items))
 
+
+def _iter_notification_items(items: Sequence[Tag]) -> Iterator[Notification]:
+    """Yield the parsed notification for each list item, skipping invalid ones."""
     for index, item in enumerate(items):
         try:
             notification = _parse_single_notification(item)
@@ -120,9 +151,7 @@ def _parse_notification_items(soup: BeautifulSoup) -> list[Notification]:
                 f"Failed to parse notification item at index {index}"
             ) from e
         if notification:
-            notifications.append(notification)
-
-    return notifications
+            yield notification
 
 
 def _parse_single_notification(item: Tag) -> Notification | None:
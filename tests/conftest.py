@@ -36,6 +36,10 @@ def _isolated_site_auth_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     auth_dir = tmp_path / "auth_state"
     monkeypatch.setattr(site_auth, "AUTH_STATE_DIR", auth_dir)
     monkeypatch.setattr(site_auth, "SECRET_KEY_FILE", auth_dir / "site_secret.key")
+    # The secret is cached per process; drop any value read from another
+    # test's directory.
+    site_auth._get_server_secret.cache_clear()
+    site_auth._cached_signing_key.cache_clear()
 
 
 @pytest.fixture(autouse=True)
@@ -1,5 +1,7 @@
 import json
+import urllib.error
 import urllib.request
+from email.message import Message
 from typing import Any
 
 import pytest
@@ -110,3 +112,29 @@ def test_paginated_list_raises_when_page_cap_is_exceeded(
 
     assert len(calls) == 2
     assert api.request_count == 2
+
+
+def test_poll_notifications_returns_none_on_not_modified(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent: list[str | None] = []
+
+    def fake_urlopen(request: urllib.request.Request) -> FakeResponse:
+        sent.append(request.get_header("If-none-match"))
+        if len(sent) == 1:
+            return FakeResponse([{"id": 1}], headers={"ETag": 'W/"abc"'})
+        raise urllib.error.HTTPError(
+            request.full_url, 304, "Not Modified", Message(), None
+        )
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+
+    api = GitHubAPI("token")
+    first, headers = api.poll_notifications(all_notifications=True)
+    second, _ = api.poll_notifications(
+        all_notifications=True, if_none_match=headers["ETag"]
+    )
+
+    assert first == [{"id": 1}]
+    assert second is None
+    assert sent == [None, 'W/"abc"']
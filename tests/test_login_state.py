@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ghinbox.api import login_state
+from ghinbox.api.login_state import LoginSessionManager
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock(1_000.0)
+    monkeypatch.setattr(login_state, "time", SimpleNamespace(time=fake.time))
+    return fake
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch) -> LoginSessionManager:
+    # A fresh singleton so sessions left by other tests do not interfere
+    monkeypatch.setattr(LoginSessionManager, "_instance", None)
+    return LoginSessionManager()
+
+
+def _stored(manager: LoginSessionManager, session_id: str) -> bool:
+    return session_id in manager._shard(session_id).sessions
+
+
+def test_create_session_removes_expired_sessions(
+    manager: LoginSessionManager, clock: FakeClock
+) -> None:
+    old = manager.create_session("default")
+    clock.now += 301
+
+    new = manager.create_session("default")
+
+    assert not _stored(manager, old.session_id)
+    assert _stored(manager, new.session_id)
+
+
+def test_cleanup_skips_heap_entries_for_removed_sessions(
+    manager: LoginSessionManager, clock: FakeClock
+) -> None:
+    removed = manager.create_session("default")
+    expired = manager.create_session("default")
+    manager.remove_session(removed.session_id)
+    clock.now += 301
+
+    assert manager._cleanup_expired() == 1
+    assert not _stored(manager, expired.session_id)
+    assert all(not shard.expiry_heap for shard in manager._shards)
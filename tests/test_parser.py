@@ -10,6 +10,7 @@ from ghinbox.parser.notifications import (
     SessionExpiredError,
     extract_authenticity_token,
     is_login_page,
+    parse_first_notification_html,
     parse_notifications_html,
 )
 
@@ -254,6 +255,36 @@ class TestParseNotificationsHtml:
         assert result.generated_at >= now - timedelta(minutes=1)
 
 
+class TestParseFirstNotificationHtml:
+    """Tests for the first-item fast path."""
+
+    def test_matches_full_parse(self, pagination_page1_html: str) -> None:
+        """The first notification and item count agree with the full parser."""
+        full = parse_notifications_html(
+            html=pagination_page1_html,
+            owner="ezyang0",
+            repo="ghsim-test-20251225075653",
+        )
+
+        first, count = parse_first_notification_html(pagination_page1_html)
+
+        assert first == full.notifications[0]
+        assert count == len(full.notifications)
+
+    def test_empty_page(self) -> None:
+        """A page without notification items yields no notification."""
+        html = '<html><head><meta name="user-login" content="ezyang"></head><body></body></html>'
+
+        assert parse_first_notification_html(html) == (None, 0)
+
+    def test_raises_on_login_page(self) -> None:
+        """Login pages raise SessionExpiredError like the full parser."""
+        html = '<html><body class="logged-out"></body></html>'
+
+        with pytest.raises(SessionExpiredError):
+            parse_first_notification_html(html)
+
+
 class TestIconStateMapping:
     """Tests for icon class to state mapping."""
 
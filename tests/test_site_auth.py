@@ -20,9 +20,14 @@ async def _ok_app(scope, receive, send) -> None:
     await send({"type": "http.response.body", "body": b"ok"})
 
 
-def _request(
-    middleware: SiteAuthMiddleware, *, client, server, path: str = "/debug/state"
-) -> int:
+def _response_start(
+    middleware: SiteAuthMiddleware,
+    *,
+    client,
+    server,
+    path: str = "/debug/state",
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> dict:
     messages = []
 
     async def receive():
@@ -35,12 +40,27 @@ def _request(
         "type": "http",
         "method": "GET",
         "path": path,
-        "headers": [],
+        "headers": headers or [],
         "client": client,
         "server": server,
     }
     asyncio.run(middleware(scope, receive, send))
-    return messages[0]["status"]
+    return messages[0]
+
+
+def _request(
+    middleware: SiteAuthMiddleware, *, client, server, path: str = "/debug/state"
+) -> int:
+    start = _response_start(middleware, client=client, server=server, path=path)
+    return start["status"]
+
+
+def _signed_cookie(password: str) -> bytes:
+    serializer = site_auth._make_serializer(site_auth._cached_signing_key(password))
+    return serializer.dumps({"ok": True}).encode()
+
+
+_LOCAL = {"client": ("127.0.0.1", 12345), "server": ("127.0.0.1", 8000)}
 
 
 def test_site_auth_allows_debug_socket_requests(monkeypatch) -> None:
@@ -105,7 +125,73 @@ def test_server_secret_storage_is_private(tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(site_auth, "AUTH_STATE_DIR", auth_state_dir)
     monkeypatch.setattr(site_auth, "SECRET_KEY_FILE", secret_key_file)
 
-    site_auth._get_server_secret()
+    secret = site_auth._get_server_secret()
 
     assert stat.S_IMODE(auth_state_dir.stat().st_mode) == 0o700
     assert stat.S_IMODE(secret_key_file.stat().st_mode) == 0o600
+    # Later calls are served from the cache without re-reading the file.
+    secret_key_file.unlink()
+    assert site_auth._get_server_secret() == secret
+
+
+def test_login_page_escapes_next_url() -> None:
+    body = site_auth._render_login_page(
+        warning="", error="", next_url='/x"><script>alert(1)</script>'
+    )
+
+    assert isinstance(body, bytes)
+    assert b"<script>" not in body
+    assert b'value="/x&quot;&gt;&lt;script&gt;alert(1)&lt;/script&gt;"' in body
+
+
+def test_site_auth_accepts_cookie_after_other_cookies(monkeypatch) -> None:
+    monkeypatch.setenv("GHINBOX_SITE_PASSWORD", "secret")
+    middleware = SiteAuthMiddleware(_ok_app)
+    cookie = b"theme=dark; other=1; ghinbox_site_session=" + _signed_cookie("secret")
+
+    start = _response_start(middleware, headers=[(b"cookie", cookie)], **_LOCAL)
+
+    assert start["status"] == 200
+
+
+def test_site_auth_accepts_cookie_in_second_cookie_header(monkeypatch) -> None:
+    monkeypatch.setenv("GHINBOX_SITE_PASSWORD", "secret")
+    middleware = SiteAuthMiddleware(_ok_app)
+    headers = [
+        (b"cookie", b"theme=dark"),
+        (b"cookie", b"ghinbox_site_session=" + _signed_cookie("secret")),
+    ]
+
+    start = _response_start(middleware, headers=headers, **_LOCAL)
+
+    assert start["status"] == 200
+
+
+def test_site_auth_redirects_html_requests_to_login(monkeypatch) -> None:
+    monkeypatch.setenv("GHINBOX_SITE_PASSWORD", "secret")
+    middleware = SiteAuthMiddleware(_ok_app)
+
+    for cookie_headers in ([], [(b"cookie", b"ghinbox_site_session=garbage")]):
+        start = _response_start(
+            middleware,
+            path="/notifications/view",
+            headers=[*cookie_headers, (b"accept", b"text/html,*/*;q=0.8")],
+            **_LOCAL,
+        )
+
+        assert start["status"] == 302
+        assert (
+            dict(start["headers"])[b"location"]
+            == b"/site-auth/login?next=%2Fnotifications%2Fview"
+        )
+
+
+def test_site_auth_rejects_api_requests_with_json_401(monkeypatch) -> None:
+    monkeypatch.setenv("GHINBOX_SITE_PASSWORD", "secret")
+    middleware = SiteAuthMiddleware(_ok_app)
+
+    for cookie_headers in ([], [(b"cookie", b"ghinbox_site_session=garbage")]):
+        start = _response_start(middleware, headers=cookie_headers, **_LOCAL)
+
+        assert start["status"] == 401
+        assert dict(start["headers"])[b"content-type"] == b"application/json"